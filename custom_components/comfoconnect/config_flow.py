@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Awaitable
+from functools import cached_property
+from time import monotonic
 from typing import Any
 
 import aiocomfoconnect
@@ -11,7 +15,9 @@ from aiocomfoconnect import Bridge
 from aiocomfoconnect.exceptions import AioComfoConnectTimeout, ComfoConnectNotAllowed
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PIN
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.uuid import random_uuid_hex
 
@@ -24,8 +30,175 @@ PIN_VALIDATOR = vol.All(
     vol.Range(min=0, max=9999, msg="A PIN must be between 0000 and 9999"),
 )
 OPTIONAL_PIN_SCHEMA = vol.Optional(CONF_PIN, default="")
+MANUAL_SCHEMA = vol.Schema({vol.Required(CONF_HOST): str, OPTIONAL_PIN_SCHEMA: str})
+ENTER_PIN_SCHEMA = vol.Schema({vol.Required(CONF_PIN): PIN_VALIDATOR})
+DISCOVERY_CACHE_TTL = 30
+DISCOVERY_TIMEOUT = 5
+DISCOVERY_RETRY_TIMEOUT = 8
+REGISTER_TIMEOUT = 15
+BRIDGE_IDLE_TIMEOUT = 300
 _LOGGER = logging.getLogger(__name__)
 
+# Discovery results per host (None for a broadcast), so form re-submits don't scan the network again
+_DISCOVERY_CACHE: dict[str | None, tuple[float, list[tuple[str, str]]]] = {}
+
+# Discoveries that are still running, so concurrent flows share a single scan
+_INFLIGHT: dict[str | None, asyncio.Task[list[tuple[str, str]]]] = {}
+
+
+async def _discover(host: str | None, timeout: float) -> list[tuple[str, str]]:
+    """Discover bridges and cache the result."""
+    try:
+        bridges = await aiocomfoconnect.discover_bridges(host, timeout=timeout)
+    finally:
+        del _INFLIGHT[host]
+
+    discovered = [(bridge.host, bridge.uuid) for bridge in bridges]
+    if discovered:
+        # Don't cache misses, the bridge might just be powering up
+        _DISCOVERY_CACHE[host] = (monotonic(), discovered)
+
+    return discovered
+
+
+def _log_discovery_error(task: asyncio.Task[list[tuple[str, str]]]) -> None:
+    """Retrieve the error of a shared discovery, since all callers might have gone away."""
+    if not task.cancelled() and (err := task.exception()) is not None:
+        _LOGGER.debug("Bridge discovery failed: %s", err)
+
+
+async def _cached_discover(host: str | None = None, timeout: float = 1) -> list[Bridge]:
+    """Discover bridges, reusing a recent or running discovery for the same host."""
+    cached = _DISCOVERY_CACHE.get(host)
+    if cached is not None and monotonic() - cached[0] < DISCOVERY_CACHE_TTL:
+        discovered = cached[1]
+    else:
+        if (inflight := _INFLIGHT.get(host)) is None:
+            inflight = _INFLIGHT[host] = asyncio.create_task(_discover(host, timeout))
+            inflight.add_done_callback(_log_discovery_error)
+
+        # Shield the shared discovery, so one caller going away doesn't cancel it for the others
+        discovered = await asyncio.shield(inflight)
+
+    # Hand out fresh Bridge objects, since the flow will connect with them
+    return [Bridge(bridge_host, bridge_uuid) for bridge_host, bridge_uuid in discovered]
+
+
+def _cached_bridge(host: str) -> Bridge | None:
+    """Return the bridge at host from a recent directed or broadcast discovery."""
+    for key in (host, None):
+        cached = _DISCOVERY_CACHE.get(key)
+        if cached is None or monotonic() - cached[0] >= DISCOVERY_CACHE_TTL:
+            continue
+        for bridge_host, bridge_uuid in cached[1]:
+            # A directed discovery only returns the bridge we asked for, even if it reports another address
+            if key is not None or bridge_host == host:
+                return Bridge(bridge_host, bridge_uuid)
+
+    return None
+
+
+async def _is_allowed(request: Awaitable[Any]) -> bool:
+    """Return False when the bridge refuses the request."""
+    try:
+        await request
+    except ComfoConnectNotAllowed:
+        return False
+
+    return True
+
+
+async def _discover_host(host: str, timeout: float = DISCOVERY_TIMEOUT) -> Bridge | None:
+    """Discover the bridge at host, racing a directed discovery against a broadcast."""
+    if (bridge := _cached_bridge(host)) is not None:
+        return bridge
+
+    # A directed discovery returns as soon as the bridge replies, so a long timeout only costs time when it's unreachable.
+    # A broadcast always waits for the full timeout, so it keeps the short library default.
+    directed = asyncio.create_task(_cached_discover(host, timeout))
+    broadcast = asyncio.create_task(_cached_discover())
+    pending = {directed, broadcast}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            if directed in done and (bridges := directed.result()):
+                return bridges[0]
+
+            if broadcast in done:
+                if broadcast.exception() is not None:
+                    # A broadcast isn't possible on every network, rely on the directed discovery
+                    _LOGGER.debug("Broadcast discovery failed: %s", broadcast.exception())
+                    continue
+                if bridge := next((bridge for bridge in broadcast.result() if bridge.host == host), None):
+                    return bridge
+    finally:
+        for task in pending:
+            task.cancel()
+
+    return None
+
+
+class BridgePool:
+    """Keep bridge connections open for a while, so a config flow can reuse them."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the bridge pool."""
+        self.hass = hass
+        self._idle: dict[tuple[str, str], tuple[Bridge, CALLBACK_TYPE]] = {}
+
+    async def acquire(self, bridge: Bridge, local_uuid: str) -> Bridge:
+        """Return a connection to the bridge, reusing an idle one when it's still open."""
+        if (idle := self._idle.pop((bridge.uuid, local_uuid), None)) is not None:
+            pooled, cancel_close = idle
+            cancel_close()
+            if pooled.is_connected():
+                return pooled
+
+            # The bridge has dropped the connection in the meantime
+            self._disconnect(pooled)
+
+        await bridge.connect(local_uuid)
+        return bridge
+
+    @callback
+    def release(self, bridge: Bridge, local_uuid: str, keep_open: bool = False) -> None:
+        """Release a connection, keeping it open for a while when requested."""
+        if not keep_open:
+            self._disconnect(bridge)
+            return
+
+        key = (bridge.uuid, local_uuid)
+
+        @callback
+        def close_idle(now) -> None:
+            """Close the connection when nobody has reused it."""
+            self.discard(*key)
+
+        self._idle[key] = (bridge, async_call_later(self.hass, BRIDGE_IDLE_TIMEOUT, close_idle))
+
+    @callback
+    def discard(self, bridge_uuid: str, local_uuid: str) -> None:
+        """Close an idle connection."""
+        if (idle := self._idle.pop((bridge_uuid, local_uuid), None)) is not None:
+            bridge, cancel_close = idle
+            cancel_close()
+            self._disconnect(bridge)
+
+    @callback
+    def _disconnect(self, bridge: Bridge) -> None:
+        """Disconnect in the background, we don't need to wait for the connection to close."""
+        self.hass.async_create_background_task(bridge.disconnect(), name="comfoconnect-disconnect")
+
+
+@callback
+def _async_get_bridge_pool(hass: HomeAssistant) -> BridgePool:
+    """Return the bridge pool shared by all config flows."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "bridge_pool" not in domain_data:
+        domain_data["bridge_pool"] = BridgePool(hass)
+    return domain_data["bridge_pool"]
+
 
 class ComfoConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a ComfoConnect config flow."""
@@ -35,12 +208,14 @@ class ComfoConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the Hue flow."""
         self.bridge: Bridge | None = None
-        self.local_uuid: str | None = None
+        # Generate our own UUID, unless one is provided by an import or reauth
+        self.local_uuid: str = random_uuid_hex()
         self.discovered_bridges: dict[str, Bridge] | None = None
 
     async def async_step_import(self, import_config: ConfigType | None) -> FlowResult:
         """Import a config entry from configuration.yaml."""
-        self.local_uuid = import_config.get("token")
+        if token := import_config.get("token"):
+            self.local_uuid = token
         return await self.async_step_manual({CONF_HOST: import_config[CONF_HOST]})
 
     async def async_step_reauth(self, user_input: dict[str, Any] | None = None) -> FlowResult:
@@ -73,8 +248,9 @@ class ComfoConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     errors["base"] = "cannot_connect"
 
         # Find bridges on the network and filter out the ones we already have configured
-        bridges = await aiocomfoconnect.discover_bridges()
-        self.discovered_bridges = {bridge.uuid: bridge for bridge in bridges if bridge.uuid not in self._async_current_ids(False)}
+        configured = frozenset(self._async_current_ids(False))
+        bridges = await _cached_discover()
+        self.discovered_bridges = {bridge.uuid: bridge for bridge in bridges if bridge.uuid not in configured}
 
         # Show the bridge selection form
         return self._show_user_form(errors, None)
@@ -83,13 +259,21 @@ class ComfoConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle manual bridge setup."""
         errors: dict[str, str] = {}
         if user_input is not None and user_input[CONF_HOST] is not None:
-            # We need to discover the bridge to get its UUID
-            bridges = await aiocomfoconnect.discover_bridges(user_input[CONF_HOST])
-            if len(bridges) == 0:
+            # Don't probe a host we already have configured
+            self._async_abort_entries_match({CONF_HOST: user_input[CONF_HOST]})
+
+            # We need to discover the bridge to get its UUID, unless the user step has already found it
+            bridge = next((bridge for bridge in (self.discovered_bridges or {}).values() if bridge.host == user_input[CONF_HOST]), None)
+            if bridge is None:
+                bridge = await _discover_host(user_input[CONF_HOST])
+            if bridge is None:
+                # A single missed reply shouldn't fail the flow, try once more with a longer timeout
+                bridge = await _discover_host(user_input[CONF_HOST], DISCOVERY_RETRY_TIMEOUT)
+            if bridge is None:
                 # Could not discover the bridge
                 errors = {"base": "invalid_host"}
             else:
-                self.bridge = bridges[0]
+                self.bridge = bridge
                 # Don't allow to configure the same bridge twice
                 await self.async_set_unique_id(self.bridge.uuid, raise_on_progress=False)
                 self._abort_if_unique_id_configured()
@@ -111,8 +295,12 @@ class ComfoConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return None
 
         try:
-            pin = PIN_VALIDATOR(pin_input)
-        except vol.Invalid:
+            pin = int(pin_input)
+        except (TypeError, ValueError):
+            errors[CONF_PIN] = "invalid_pin"
+            return None
+
+        if not 0 <= pin <= 9999:
             errors[CONF_PIN] = "invalid_pin"
             return None
 
@@ -125,84 +313,49 @@ class ComfoConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         else:
             uuid_field = vol.Required(CONF_UUID)
 
+        choices: dict[str, str] = {}
+        for bridge in (self.discovered_bridges or {}).values():
+            choices[bridge.uuid] = bridge.host
+        choices[COMFOCONNECT_MANUAL_BRIDGE_ID] = "Manually add a ComfoConnect LAN C Bridge"
+
         return self.async_show_form(
             step_id="user",
             errors=errors,
-            data_schema=vol.Schema(
-                {
-                    uuid_field: vol.In(
-                        {
-                            **{bridge.uuid: bridge.host for bridge in (self.discovered_bridges or {}).values()},
-                            COMFOCONNECT_MANUAL_BRIDGE_ID: "Manually add a ComfoConnect LAN C Bridge",
-                        }
-                    ),
-                }
-            ),
+            data_schema=vol.Schema({uuid_field: vol.In(choices)}),
         )
 
     def _show_manual_form(self, errors: dict[str, str], host: str | None) -> FlowResult:
         """Show the manual host entry form."""
+        data_schema = MANUAL_SCHEMA
         if host is not None:
-            host_field = vol.Required(CONF_HOST, default=host)
-        else:
-            host_field = vol.Required(CONF_HOST)
+            data_schema = self.add_suggested_values_to_schema(data_schema, {CONF_HOST: host})
 
         return self.async_show_form(
             step_id="manual",
             errors=errors,
-            data_schema=vol.Schema({host_field: str, OPTIONAL_PIN_SCHEMA: str}),
+            data_schema=data_schema,
         )
 
     async def _register(self, pin: int | None = None) -> FlowResult:
         """Register on the bridge."""
 
-        if self.local_uuid is None:
-            # Generate our own UUID if none is provided
-            self.local_uuid = random_uuid_hex()
+        # The bridge might have been configured by another flow while this one was waiting for input.
+        # A reauth flow carries the unique id of its own entry, so it would always abort here.
+        if self.context.get("source") != config_entries.SOURCE_REAUTH:
+            self._abort_if_unique_id_configured()
 
-        # Connect to the bridge
-        await self.bridge.connect(self.local_uuid)
         try:
-            if pin is not None:
-                try:
-                    await self.bridge.cmd_register_app(
-                        self.local_uuid,
-                        f"Home Assistant ({self.hass.config.location_name})",
-                        pin,
-                    )
-                except ComfoConnectNotAllowed:
-                    # The app is already registered, proceed with session start.
-                    pass
-
-            try:
-                await self.bridge.cmd_start_session(True)
-
-            except ComfoConnectNotAllowed:
-                if pin is not None:
-                    # We have tried connecting, but we have an invalid PIN. Ask the user for a new PIN.
-                    return await self.async_step_enter_pin({}, {"base": "invalid_pin"})
+            async with asyncio.timeout(REGISTER_TIMEOUT):
+                result = await self._start_session(pin)
+        except TimeoutError as err:
+            raise AioComfoConnectTimeout("Timeout while registering on the bridge") from err
 
-                try:
-                    # We probably are not registered yet, lets try to register.
-                    await self.bridge.cmd_register_app(
-                        self.local_uuid,
-                        f"Home Assistant ({self.hass.config.location_name})",
-                        DEFAULT_PIN,
-                    )
-
-                except ComfoConnectNotAllowed:
-                    # We have tried connecting, but we have an invalid PIN. Ask the user for a new PIN.
-                    return await self.async_step_enter_pin({}, {})
-
-                # Registration went fine, connect to the bridge again
-                await self.bridge.cmd_start_session(True)
-
-        finally:
-            # Disconnect
-            await self.bridge.disconnect()
+        if result is not None:
+            # The bridge didn't accept our PIN, ask the user for one
+            return result
 
         if self.context.get("source") == config_entries.SOURCE_REAUTH:
-            self.hass.async_create_task(self.hass.config_entries.async_reload(self.context["entry_id"]))
+            self.hass.config_entries.async_schedule_reload(self.context["entry_id"])
             return self.async_abort(reason="reauth_successful")
 
         return self.async_create_entry(
@@ -214,6 +367,49 @@ class ComfoConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             },
         )
 
+    @cached_property
+    def _app_name(self) -> str:
+        """Return the name we register with on the bridge."""
+        return f"Home Assistant ({self.hass.config.location_name})"
+
+    async def _start_session(self, pin: int | None) -> FlowResult | None:
+        """Start a session on the bridge, returning the PIN form when our PIN isn't accepted."""
+        # Connect to the bridge, reusing the connection we kept open while asking for a PIN
+        pool = _async_get_bridge_pool(self.hass)
+        self.bridge = await pool.acquire(self.bridge, self.local_uuid)
+
+        keep_connected = False
+        try:
+            if pin is not None:
+                # Registering is refused when we are already registered, the session start tells us if the PIN was accepted.
+                await _is_allowed(self.bridge.cmd_register_app(self.local_uuid, self._app_name, pin))
+                if not await _is_allowed(self.bridge.cmd_start_session(True)):
+                    # We have tried connecting, but we have an invalid PIN. Ask the user for a new PIN.
+                    keep_connected = True
+                    return await self.async_step_enter_pin({}, {"base": "invalid_pin"})
+
+            elif not await _is_allowed(self.bridge.cmd_start_session(True)):
+                # We probably are not registered yet, lets try to register.
+                if not await _is_allowed(self.bridge.cmd_register_app(self.local_uuid, self._app_name, DEFAULT_PIN)):
+                    # The bridge isn't using the default PIN. Ask the user for the PIN.
+                    keep_connected = True
+                    return await self.async_step_enter_pin({}, {})
+
+                # Registration went fine, connect to the bridge again
+                await self.bridge.cmd_start_session(True)
+
+        finally:
+            # Keep the connection open while asking for a PIN, so the retry doesn't have to connect again
+            pool.release(self.bridge, self.local_uuid, keep_connected)
+
+        return None
+
+    @callback
+    def async_remove(self) -> None:
+        """Close a connection that was kept open for a PIN retry when the flow is removed."""
+        if self.bridge is not None:
+            _async_get_bridge_pool(self.hass).discard(self.bridge.uuid, self.local_uuid)
+
     async def async_step_enter_pin(
         self,
         user_input: dict[str, Any] | None = None,
@@ -229,9 +425,5 @@ class ComfoConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="enter_pin",
             errors=errors or {},
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_PIN): PIN_VALIDATOR
-                }
-            ),
+            data_schema=ENTER_PIN_SCHEMA,
         )